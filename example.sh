@@ -31,7 +31,7 @@ python quick_cut.py sample_data --output with_captions.mp4 --burn-captions
 python quick_cut.py sample_data --output captions_top.mp4 --burn-captions --caption-position top --caption-font-size 40
 
 # With custom font for captions (helpful if default font has issues)
-python quick_cut.py sample_data --output custom_font.mp4 --burn-captions --caption-font "DejaVu-Sans"
+python quick_cut.py sample_data --output custom_font.mp4 --burn-captions --caption-font "DejaVuSans.ttf"
 
 # Generate SRT subtitle file alongside the video
 python quick_cut.py sample_data --output with_srt.mp4 --generate-subtitles
@@ -46,7 +46,7 @@ python quick_cut.py sample_data --output with_both.mp4 --burn-captions --generat
 # python quick_cut.py sample_data --output chinese_tw.mp4 --language zh-TW
 
 # For Simplified Chinese with burned-in captions (specify a font that supports Chinese)
-# python quick_cut.py sample_data --output chinese_captions.mp4 --language zh-CN --burn-captions --caption-font "Noto Sans SC"
+# python quick_cut.py sample_data --output chinese_captions.mp4 --language zh-CN --burn-captions --caption-font "NotoSansSC-Regular.otf"
 
 # For Traditional Chinese with burned-in captions and custom font path
 # python quick_cut.py sample_data --output chinese_tw_captions.mp4 --language zh-TW --burn-captions --caption-font "/path/to/chinese_font.ttf"
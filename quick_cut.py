@@ -1,55 +1,92 @@
 #!/usr/bin/env python3
 import os
-import glob
 import re
-from gtts import gTTS
-from moviepy.editor import *
+import shutil
 import argparse
+import importlib.util
+import json
+import logging
 import tempfile
 import subprocess
 import sys
 import time  # Add time module for timing functionality
 import asyncio  # For EdgeTTS
+import atexit
+import functools
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
 
-# Add EdgeTTS import
-try:
-    import edge_tts
-    EDGE_TTS_AVAILABLE = True
-except ImportError:
-    EDGE_TTS_AVAILABLE = False
+# Heavy media and TTS packages are imported lazily where they're used, so that
+# --help, --list-* and argument errors don't pay for loading them.
+# Whether the optional TTS engines are installed is only checked on first use.
+@functools.lru_cache(maxsize=1)
+def _edge_tts_available():
+    return importlib.util.find_spec('edge_tts') is not None
 
-# Add PIL/Pillow compatibility patch for newer versions
-try:
-    from PIL import Image
-    if not hasattr(Image, 'ANTIALIAS'):
-        # For Pillow >= 9.0.0
-        Image.ANTIALIAS = Image.Resampling.LANCZOS
-except (ImportError, AttributeError):
-    pass
-
-# Check if ImageMagick is installed (needed for TextClip)
-def is_imagemagick_installed():
-    """Check if ImageMagick is installed and available in the path"""
-    try:
-        # Try to run 'convert -version' (ImageMagick command)
-        result = subprocess.run(
-            ['convert', '-version'], 
-            stdout=subprocess.PIPE, 
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        return 'ImageMagick' in result.stdout
-    except (subprocess.SubprocessError, FileNotFoundError):
-        return False
+# For offline TTS
+@functools.lru_cache(maxsize=1)
+def _pyttsx3_available():
+    return importlib.util.find_spec('pyttsx3') is not None
 
-IMAGEMAGICK_AVAILABLE = is_imagemagick_installed()
+# ffmpeg/ffprobe binaries used for audio/video processing
+FFMPEG_BINARY = os.environ.get('FFMPEG_BINARY', 'ffmpeg')
+FFPROBE_BINARY = os.environ.get('FFPROBE_BINARY', 'ffprobe')
 
-# For offline TTS
-try:
-    import pyttsx3
-    PYTTSX3_AVAILABLE = True
-except ImportError:
-    PYTTSX3_AVAILABLE = False
+# Splits filenames into digit and non-digit runs for natural sorting
+_NAT_RE = re.compile(r'(\d+)')
+
+# Serializes pyttsx3 use, since its engine can't run from several threads at once
+_PYTTSX3_LOCK = threading.Lock()
+
+# pyttsx3 engine and the voice id chosen per language, created on first use
+_PYTTSX3_ENGINE = None
+_PYTTSX3_VOICES = {}
+
+# Event loop shared by all Edge TTS calls, created on first use
+_EDGE_LOOP = None
+
+# Maximum number of captions synthesized at the same time
+TTS_CONCURRENCY = 8
+
+# Progress messages, warnings and errors; main() sends them to stdout/stderr
+log = logging.getLogger('quick_cut')
+
+class _LevelFormatter(logging.Formatter):
+    """Prefix warnings and errors with their level ("Warning: ...") and leave progress messages plain"""
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno >= logging.WARNING:
+            return f"{record.levelname.capitalize()}: {message}"
+        return message
+
+# Where slow lookups (e.g. the system font scan) are cached between runs
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'), 'quick_cut')
+
+# Command-line choices, converted once after parsing so later code compares ints, not strings
+class _Choice(IntEnum):
+    @classmethod
+    def parse(cls, value):
+        """Return the member for a choice string such as 'bottom' (members are passed through)
+        
+        Raises KeyError for a value that is not one of the choices.
+        """
+        return value if isinstance(value, cls) else cls[str(value).upper()]
+
+class CaptionPos(_Choice):
+    TOP = 0
+    MIDDLE = 1
+    BOTTOM = 2
+
+class SubFormat(_Choice):
+    SRT = 0
+    VTT = 1
+
+class TTSMethod(_Choice):
+    EDGE = 0
+    GTTS = 1
+    PYTTSX3 = 2
 
 # Supported languages dictionary with description
 SUPPORTED_LANGUAGES = {
@@ -85,50 +122,193 @@ EDGE_TTS_VOICES = {
     'vi': ['vi-VN-HoaiMyNeural', 'vi-VN-NamMinhNeural']
 }
 
-# Language-specific font recommendations
+# Language-specific font recommendations (file names Pillow can find in the system font directories)
 LANGUAGE_FONTS = {
     # CJK fonts (Chinese, Japanese, Korean)
-    'zh-TW': ['Noto Sans TC', 'Microsoft JhengHei', 'SimSun', 'Arial Unicode MS'],
-    'zh-CN': ['Noto Sans SC', 'Microsoft YaHei', 'SimSun', 'Arial Unicode MS'],
-    'ja': ['Noto Sans JP', 'MS Gothic', 'Meiryo', 'Arial Unicode MS'],
-    'ko': ['Noto Sans KR', 'Malgun Gothic', 'Gulim', 'Arial Unicode MS'],
+    'zh-TW': ['NotoSansTC-Regular.otf', 'NotoSansCJK-Regular.ttc', 'msjh.ttc', 'simsun.ttc', 'Arial Unicode.ttf'],
+    'zh-CN': ['NotoSansSC-Regular.otf', 'NotoSansCJK-Regular.ttc', 'msyh.ttc', 'simsun.ttc', 'Arial Unicode.ttf'],
+    'ja': ['NotoSansJP-Regular.otf', 'NotoSansCJK-Regular.ttc', 'msgothic.ttc', 'meiryo.ttc', 'Arial Unicode.ttf'],
+    'ko': ['NotoSansKR-Regular.otf', 'NotoSansCJK-Regular.ttc', 'malgun.ttf', 'gulim.ttc', 'Arial Unicode.ttf'],
     # Cyrillic
-    'ru': ['Noto Sans', 'Arial', 'DejaVu Sans'],
+    'ru': ['NotoSans-Regular.ttf', 'arial.ttf', 'DejaVuSans.ttf'],
     # Thai
-    'th': ['Noto Sans Thai', 'Tahoma', 'Arial Unicode MS'],
+    'th': ['NotoSansThai-Regular.ttf', 'tahoma.ttf', 'Arial Unicode.ttf'],
     # Default Latin script fonts
-    'default': ['Arial', 'DejaVu-Sans', 'Verdana', 'Helvetica', None]
+    'default': ['arial.ttf', 'Arial.ttf', 'DejaVuSans.ttf', 'Verdana.ttf', 'Helvetica.ttc']
 }
 
+@functools.lru_cache(maxsize=32)
+def _resolve_font(lang, user_font, size):
+    """Load a caption font - start with user font, fallback to language-specific, then default
+    
+    Returns a (font, name, language_font) tuple. name is None if no TrueType font could be
+    found and Pillow's built-in font is used instead. language_font is False if the language
+    has its own fonts but only a default Latin font loaded, so its script may not render.
+    """
+    from PIL import ImageFont
+    
+    preferred = ([user_font] if user_font else []) + LANGUAGE_FONTS.get(lang, [])
+    for name in preferred + LANGUAGE_FONTS['default']:
+        try:
+            return ImageFont.truetype(name, size), name, name in preferred or lang not in LANGUAGE_FONTS
+        except OSError:
+            continue
+    try:
+        # Pillow >= 10.1 can scale its built-in font
+        return ImageFont.load_default(size), None, False
+    except TypeError:
+        return ImageFont.load_default(), None, False
+
+def _wrap_caption(draw, text, font, max_width):
+    """Greedily wrap text into lines no wider than max_width, breaking inside
+    words that don't fit on a line of their own (e.g. CJK text without spaces)"""
+    lines = []
+    for paragraph in text.splitlines():
+        line = ''
+        for word in paragraph.split(' '):
+            candidate = f"{line} {word}" if line else word
+            if draw.textlength(candidate, font=font) <= max_width:
+                line = candidate
+                continue
+            if line:
+                lines.append(line)
+            line = ''
+            for char in word:
+                if line and draw.textlength(line + char, font=font) > max_width:
+                    lines.append(line)
+                    line = ''
+                line += char
+        lines.append(line)
+    return lines
+
+def burn_caption(image_file, output_file, text, font, position=CaptionPos.BOTTOM, max_width=None, margin=20, padding=10):
+    """Draw a centered caption on a semi-transparent black box over an image and save it as PNG"""
+    from PIL import Image, ImageDraw
+    
+    with Image.open(image_file) as im:
+        base = im.convert('RGB')
+    width, height = base.size
+    max_width = max_width or int(width * 0.8)
+    draw = ImageDraw.Draw(base)
+    
+    caption = '\n'.join(_wrap_caption(draw, text, font, max_width - 2 * padding))
+    left, top, right, bottom = draw.multiline_textbbox((0, 0), caption, font=font, align='center')
+    box_height = bottom - top + 2 * padding
+    
+    # Position the caption based on user choice (anything unrecognized goes at the bottom)
+    try:
+        position = CaptionPos.parse(position)
+    except KeyError:
+        position = CaptionPos.BOTTOM
+    if position == CaptionPos.TOP:
+        y = margin
+    elif position == CaptionPos.MIDDLE:
+        y = (height - box_height) // 2
+    else:  # bottom
+        y = height - box_height - margin
+    
+    # Only the caption box needs alpha blending; the rest of the frame stays plain RGB
+    x = (width - max_width) // 2
+    box = (x, y, x + max_width, y + box_height)
+    region = base.crop(box).convert('RGBA')
+    shade = Image.new('RGBA', region.size, (0, 0, 0, 0xaf))
+    base.paste(Image.alpha_composite(region, shade).convert('RGB'), box[:2])
+    
+    draw.multiline_text(((width - (right - left)) // 2 - left, y + padding - top), caption,
+                        font=font, fill='white', align='center')
+    
+    base.save(output_file, compress_level=1)
+    return output_file
+
+def run_ffmpeg(*args):
+    """Run ffmpeg quietly with the given arguments, raising if it fails"""
+    subprocess.run([FFMPEG_BINARY, '-hide_banner', '-loglevel', 'error', '-y', *args], check=True)
+
+def audio_duration(audio_file):
+    """Read an audio file's duration in seconds from its container headers using ffprobe"""
+    return float(subprocess.check_output([
+        FFPROBE_BINARY, '-v', 'error', '-show_entries', 'format=duration',
+        '-of', 'default=nk=1:nw=1', audio_file
+    ]))
+
+def atempo_filter(speed_factor):
+    """Build an ffmpeg atempo filter chain, since a single atempo only accepts 0.5-2.0"""
+    filters = []
+    while speed_factor > 2.0:
+        filters.append('atempo=2.0')
+        speed_factor /= 2.0
+    while speed_factor < 0.5:
+        filters.append('atempo=0.5')
+        speed_factor /= 0.5
+    filters.append(f'atempo={speed_factor}')
+    return ','.join(filters)
+
+def merge_audio(audio_files, segment_durations, output_file):
+    """Concatenate narration files into a single track, padding each with silence to its segment duration"""
+    inputs = []
+    filters = []
+    for i, (audio_file, segment) in enumerate(zip(audio_files, segment_durations)):
+        inputs += ['-i', audio_file]
+        # Normalize the format so narration from any TTS engine can be joined, then pad with silence
+        filters.append(f"[{i}:a]aresample=44100,aformat=channel_layouts=stereo,"
+                       f"apad,atrim=duration={segment:.3f}[a{i}]")
+    labels = ''.join(f"[a{i}]" for i in range(len(audio_files)))
+    filters.append(f"{labels}concat=n={len(audio_files)}:v=0:a=1[aout]")
+    run_ffmpeg(*inputs, '-filter_complex', ';'.join(filters), '-map', '[aout]',
+               '-c:a', 'pcm_s16le', output_file)
+    return output_file
+
 def natural_sort_key(s):
     """Sort strings containing numbers naturally"""
-    return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', s)]
+    return tuple(int(c) if c.isdigit() else c.lower() for c in _NAT_RE.split(s))
 
 def get_file_pairs(directory):
     """Find all text files and their corresponding images in the directory"""
-    text_files = sorted(glob.glob(os.path.join(directory, "*.txt")), key=natural_sort_key)
+    # Bucket every file by its base name in a single directory scan
+    # (raises OSError, e.g. FileNotFoundError, if the directory is missing or unreadable)
+    entries = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            # is_file() uses the cached directory entry type, so no stat call per file
+            if entry.is_file():
+                stem, ext = os.path.splitext(entry.name)
+                entries.setdefault(stem, {})[ext.lower()] = entry.path
+    
     pairs = []
     
-    for text_file in text_files:
-        basename = os.path.splitext(os.path.basename(text_file))[0]
+    for stem in sorted((stem for stem, files in entries.items() if '.txt' in files), key=natural_sort_key):
+        files = entries[stem]
+        text_file = files['.txt']
         # Look for corresponding image (jpg, jpeg, or png)
-        jpg_file = os.path.join(directory, f"{basename}.jpg")
-        jpeg_file = os.path.join(directory, f"{basename}.jpeg")
-        png_file = os.path.join(directory, f"{basename}.png")
+        image_file = files.get('.jpg') or files.get('.jpeg') or files.get('.png')
         
-        if os.path.exists(jpg_file):
-            pairs.append((text_file, jpg_file))
-        elif os.path.exists(jpeg_file):
-            pairs.append((text_file, jpeg_file))
-        elif os.path.exists(png_file):
-            pairs.append((text_file, png_file))
+        if image_file:
+            pairs.append((text_file, image_file))
         else:
-            print(f"Warning: No matching image found for {text_file}")
+            log.warning("No matching image found for %s", text_file)
     
     return pairs
 
+def prepare_image(image_file, output_file, resolution):
+    """Decode and downsample an image to the target resolution once, saving it as PNG"""
+    from PIL import Image
+    
+    with Image.open(image_file) as im:
+        # Let the JPEG decoder shrink the image while decoding (no-op for other formats)
+        im.draft('RGB', resolution)
+        resized = im.convert('RGB').resize(resolution, Image.LANCZOS)
+    resized.save(output_file, compress_level=1)
+    return output_file
+
+def prepare_images(file_pairs, temp_dir, resolution, executor):
+    """Start resizing every slide image on the executor, returning one future per slide"""
+    return [executor.submit(prepare_image, image_file, os.path.join(temp_dir, f"img_{i}.png"), resolution)
+            for i, (_, image_file) in enumerate(file_pairs)]
+
 def text_to_speech_gtts(text, output_file, lang='en', speed_factor=1.0):
     """Convert text to speech using Google TTS and save as audio file"""
+    from gtts import gTTS
+    
     try:
         # Use a temporary file if we need to adjust speed
         temp_file = None
@@ -144,28 +324,34 @@ def text_to_speech_gtts(text, output_file, lang='en', speed_factor=1.0):
         
         # Apply speed adjustment if needed
         if speed_factor != 1.0:
-            # Load the audio to adjust its speed
-            audio = AudioFileClip(temp_file)
-            # Apply speed effect (speedx)
-            audio_sped = audio.fx(vfx.speedx, speed_factor)
-            # Save to the final output file
-            audio_sped.write_audiofile(output_file, verbose=False, logger=None)
+            # Let ffmpeg change the tempo in a single decode/encode pass
+            run_ffmpeg('-i', temp_file, '-filter:a', atempo_filter(speed_factor), output_file)
             # Clean up the temporary file
-            audio.close()
-            audio_sped.close()
             os.remove(temp_file)
             
         return output_file
     except Exception as e:
-        print(f"Error generating speech for language '{lang}': {e}")
-        print("Falling back to English...")
+        log.warning("Error generating speech for language '%s': %s", lang, e)
+        log.warning("Falling back to English...")
         tts = gTTS(text=text, lang='en', slow=False)
         tts.save(output_file)
         return output_file
 
 def text_to_speech_pyttsx3(text, output_file, lang='en', speed_factor=1.0):
     """Convert text to speech using pyttsx3 (offline) and save as audio file"""
-    engine = pyttsx3.init()
+    with _PYTTSX3_LOCK:
+        return _text_to_speech_pyttsx3(text, output_file, lang, speed_factor)
+
+def _get_pyttsx3():
+    """Return the shared pyttsx3 engine, initializing the driver on first use"""
+    global _PYTTSX3_ENGINE
+    if _PYTTSX3_ENGINE is None:
+        import pyttsx3
+        _PYTTSX3_ENGINE = pyttsx3.init()
+    return _PYTTSX3_ENGINE
+
+def _text_to_speech_pyttsx3(text, output_file, lang='en', speed_factor=1.0):
+    engine = _get_pyttsx3()
     
     # Get temporary WAV file path
     temp_wav = tempfile.NamedTemporaryFile(suffix='.wav', delete=False).name
@@ -177,27 +363,29 @@ def text_to_speech_pyttsx3(text, output_file, lang='en', speed_factor=1.0):
     engine.setProperty('rate', adjusted_rate)    # Speed of speech
     engine.setProperty('volume', 1.0)  # Volume (0.0 to 1.0)
     
-    print(f"  Using speech rate: {adjusted_rate} (speed factor: {speed_factor})")
+    log.info("  Using speech rate: %s (speed factor: %s)", adjusted_rate, speed_factor)
     
     # Try to set a voice for the selected language (pyttsx3 has limited language support)
-    voices = engine.getProperty('voices')
     if lang != 'en':
-        print(f"  Trying to find a voice for language '{lang}'")
-        # Try to find a voice for the selected language
-        for voice in voices:
-            if lang in voice.id.lower() or lang.split('-')[0] in voice.id.lower():
-                engine.setProperty('voice', voice.id)
-                break
-        else:
-            print(f"Warning: Could not find a voice for language '{lang}'. Using default voice.")
+        if lang not in _PYTTSX3_VOICES:
+            log.info("  Trying to find a voice for language '%s'", lang)
+            # Try to find a voice for the selected language (only once per language)
+            _PYTTSX3_VOICES[lang] = None
+            for voice in engine.getProperty('voices'):
+                if lang in voice.id.lower() or lang.split('-')[0] in voice.id.lower():
+                    _PYTTSX3_VOICES[lang] = voice.id
+                    break
+            else:
+                log.warning("Could not find a voice for language '%s'. Using default voice.", lang)
+        if _PYTTSX3_VOICES[lang]:
+            engine.setProperty('voice', _PYTTSX3_VOICES[lang])
     
     # Save to WAV file first
     engine.save_to_file(text, temp_wav)
     engine.runAndWait()
     
-    # Convert WAV to MP3 using moviepy
-    audio = AudioFileClip(temp_wav)
-    audio.write_audiofile(output_file, verbose=False, logger=None)
+    # Convert WAV to MP3 using ffmpeg
+    run_ffmpeg('-i', temp_wav, '-codec:a', 'libmp3lame', output_file)
     
     # Clean up temporary file
     os.remove(temp_wav)
@@ -206,6 +394,8 @@ def text_to_speech_pyttsx3(text, output_file, lang='en', speed_factor=1.0):
 
 async def text_to_speech_edge_async(text, output_file, lang='en', voice=None, speed_factor=1.0):
     """Convert text to speech using Microsoft Edge TTS and save as audio file"""
+    import edge_tts
+    
     try:
         # Set default voice based on language if not specified
         if voice is None:
@@ -213,7 +403,7 @@ async def text_to_speech_edge_async(text, output_file, lang='en', voice=None, sp
                 voice = EDGE_TTS_VOICES[lang][0]  # Use first available voice for the language
             else:
                 # Fallback to English if the language is not supported
-                print(f"Language '{lang}' not found in EdgeTTS voices, falling back to English")
+                log.warning("Language '%s' not found in EdgeTTS voices, falling back to English", lang)
                 voice = "en-US-AriaNeural"
         
         # Calculate rate string based on speed factor
@@ -225,7 +415,7 @@ async def text_to_speech_edge_async(text, output_file, lang='en', voice=None, sp
         else:
             rate = "+0%"
         
-        print(f"  Using EdgeTTS voice: {voice}, rate: {rate}")
+        log.info("  Using EdgeTTS voice: %s, rate: %s", voice, rate)
         
         # Create TTS communicator with the selected voice and speech rate
         tts = edge_tts.Communicate(text, voice, rate=rate)
@@ -235,90 +425,186 @@ async def text_to_speech_edge_async(text, output_file, lang='en', voice=None, sp
         
         return output_file
     except Exception as e:
-        print(f"Error generating speech with Edge TTS: {e}")
-        print("Falling back to Google TTS...")
-        return text_to_speech_gtts(text, output_file, lang, speed_factor)
+        log.warning("Error generating speech with Edge TTS: %s", e)
+        log.warning("Falling back to Google TTS...")
+        # gTTS blocks, so run it off the event loop to keep the other Edge requests going
+        return await asyncio.get_running_loop().run_in_executor(
+            None, text_to_speech_gtts, text, output_file, lang, speed_factor)
+
+def _get_edge_loop():
+    """Return the shared Edge TTS event loop, creating it on first use"""
+    global _EDGE_LOOP
+    if _EDGE_LOOP is None:
+        _EDGE_LOOP = asyncio.new_event_loop()
+        atexit.register(_EDGE_LOOP.close)
+    return _EDGE_LOOP
 
 def text_to_speech_edge(text, output_file, lang='en', voice=None, speed_factor=1.0):
     """Synchronous wrapper for Edge TTS"""
-    return asyncio.run(text_to_speech_edge_async(text, output_file, lang, voice, speed_factor))
+    # Reuse one event loop instead of paying for a new one on every call
+    return _get_edge_loop().run_until_complete(
+        text_to_speech_edge_async(text, output_file, lang, voice, speed_factor))
+
+def _parse_tts_method(method):
+    """Return the TTSMethod for method, falling back to Google TTS for unknown methods"""
+    try:
+        return TTSMethod.parse(method)
+    except KeyError:
+        log.warning("Unknown TTS method '%s'. Using Google TTS instead.", method)
+        return TTSMethod.GTTS
 
-def text_to_speech(text, output_file, method='gtts', offline=False, lang='en', voice=None, speed_factor=1.0):
+def text_to_speech(text, output_file, method=TTSMethod.GTTS, offline=False, lang='en', voice=None, speed_factor=1.0):
     """Convert text to speech using the selected method"""
-    if method == 'edge' and EDGE_TTS_AVAILABLE:
+    method = _parse_tts_method(method)
+    
+    if method == TTSMethod.EDGE and _edge_tts_available():
         return text_to_speech_edge(text, output_file, lang, voice, speed_factor)
-    elif method == 'pyttsx3' and PYTTSX3_AVAILABLE:
+    elif method == TTSMethod.PYTTSX3 and _pyttsx3_available():
         return text_to_speech_pyttsx3(text, output_file, lang, speed_factor)
-    elif method == 'gtts' or method not in ['edge', 'pyttsx3']:
-        if method not in ['gtts', 'edge', 'pyttsx3']:
-            print(f"Warning: Unknown TTS method '{method}'. Using Google TTS instead.")
-        if offline and PYTTSX3_AVAILABLE:
-            print("Offline mode requested. Using pyttsx3.")
+    elif method == TTSMethod.GTTS:
+        if offline and _pyttsx3_available():
+            log.info("Offline mode requested. Using pyttsx3.")
             return text_to_speech_pyttsx3(text, output_file, lang, speed_factor)
         else:
-            if offline and not PYTTSX3_AVAILABLE:
-                print("Warning: Offline TTS requested but pyttsx3 not available. Using Google TTS instead.")
-                print("To enable offline TTS, install pyttsx3: pip install pyttsx3")
+            if offline and not _pyttsx3_available():
+                log.warning("Offline TTS requested but pyttsx3 not available. Using Google TTS instead.")
+                log.warning("To enable offline TTS, install pyttsx3: pip install pyttsx3")
             return text_to_speech_gtts(text, output_file, lang, speed_factor)
 
+async def synth_all_edge(items, lang='en', voice=None, speed_factor=1.0, concurrency=TTS_CONCURRENCY):
+    """Convert several (text, output_file) items to speech concurrently using Edge TTS"""
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def one(text, output_file):
+        async with sem:
+            return await text_to_speech_edge_async(text, output_file, lang, voice, speed_factor)
+    
+    return await asyncio.gather(*[one(text, output_file) for text, output_file in items])
+
+def synth_all(items, method=TTSMethod.GTTS, offline=False, lang='en', voice=None, speed_factor=1.0,
+              concurrency=TTS_CONCURRENCY):
+    """Convert several (text, output_file) items to speech concurrently using the selected method"""
+    # Synthesize each distinct text only once (one TTS request / Edge TTS connection),
+    # then copy the audio to any other slides with the same caption
+    first_output = {}
+    unique_items = []
+    duplicates = []
+    for text, output_file in items:
+        if text in first_output:
+            duplicates.append((first_output[text], output_file))
+        else:
+            first_output[text] = output_file
+            unique_items.append((text, output_file))
+    
+    # Resolve the method once, so an unknown one is only warned about once
+    method = _parse_tts_method(method)
+    if method == TTSMethod.EDGE and _edge_tts_available():
+        _get_edge_loop().run_until_complete(
+            synth_all_edge(unique_items, lang, voice, speed_factor, concurrency))
+    else:
+        # gTTS and pyttsx3 are blocking calls, so run them on a thread pool instead
+        def one(item):
+            text, output_file = item
+            return text_to_speech(text, output_file, method=method, offline=offline,
+                                  lang=lang, voice=voice, speed_factor=speed_factor)
+        
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(one, unique_items))
+    
+    for source, output_file in duplicates:
+        shutil.copyfile(source, output_file)
+    
+    return [output_file for _, output_file in items]
+
+def read_captions(file_pairs):
+    """Read the caption of every text/image pair"""
+    captions = []
+    for text_file, _ in file_pairs:
+        with open(text_file, 'r', encoding='utf-8') as f:
+            captions.append(f.read().strip())
+    return captions
+
+# One slide's synthesized narration, shared by the subtitle and video steps
+TTSResult = namedtuple('TTSResult', ['caption', 'audio_file', 'duration'])
+
+def synth_all_captions(captions, temp_dir, method=TTSMethod.GTTS, offline=False, lang='en', voice=None,
+                       speed_factor=1.0, concurrency=TTS_CONCURRENCY):
+    """Synthesize the narration for every caption once and measure the resulting audio
+    
+    Returns a list of TTSResult(caption, audio_file, duration) that both the subtitle
+    and video steps consume, so no caption is ever synthesized twice.
+    """
+    audio_files = [os.path.join(temp_dir, f"audio_{i}.mp3") for i in range(len(captions))]
+    
+    log.info("Synthesizing narration for %s slides...", len(captions))
+    synth_all(list(zip(captions, audio_files)), method=method, offline=offline,
+              lang=lang, voice=voice, speed_factor=speed_factor, concurrency=concurrency)
+    
+    # Get actual audio durations. Repeated captions share the same audio, so probe each
+    # distinct caption once, running the ffprobe calls in parallel
+    first_file = {}
+    for caption, audio_file in zip(captions, audio_files):
+        first_file.setdefault(caption, audio_file)
+    with ThreadPoolExecutor(max_workers=min(TTS_CONCURRENCY, len(first_file)) or 1) as executor:
+        durations = dict(zip(first_file, executor.map(audio_duration, first_file.values())))
+    
+    return [TTSResult(caption, audio_file, durations[caption])
+            for caption, audio_file in zip(captions, audio_files)]
+
+def _format_timestamp(seconds, sep):
+    """Convert seconds to HH:MM:SS<sep>mmm using integer milliseconds to avoid rounding drift"""
+    milliseconds = int(round(seconds * 1000))
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    seconds, milliseconds = divmod(milliseconds, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}{sep}{milliseconds:03d}"
+
 def format_timestamp_srt(seconds):
     """Convert seconds to SRT timestamp format: HH:MM:SS,mmm"""
-    hours, remainder = divmod(seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    milliseconds = int((seconds - int(seconds)) * 1000)
-    return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d},{milliseconds:03d}"
+    return _format_timestamp(seconds, ',')
 
 def format_timestamp_vtt(seconds):
     """Convert seconds to VTT timestamp format: HH:MM:SS.mmm"""
-    hours, remainder = divmod(seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    milliseconds = int((seconds - int(seconds)) * 1000)
-    return f"{int(hours):02d}:{int(minutes):02d}:{int(seconds):02d}.{milliseconds:03d}"
+    return _format_timestamp(seconds, '.')
 
-def create_subtitle_file(file_pairs, output_path, pause_duration=1.0, format='srt'):
-    """Generate a subtitle file (SRT or VTT) from the text files and timing information"""
-    if format not in ['srt', 'vtt']:
-        raise ValueError(f"Unsupported subtitle format: {format}")
+def create_subtitle_file(captions, output_path, pause_duration=1.0, format=SubFormat.SRT):
+    """Generate a subtitle file (SRT or VTT) from the captions and estimated timing information"""
+    import numpy as np
+    
+    try:
+        format = SubFormat.parse(format)
+    except KeyError:
+        raise ValueError(f"Unsupported subtitle format: {format}") from None
     
     # Calculate base name for subtitle file
     base_name = os.path.splitext(output_path)[0]
-    subtitle_path = f"{base_name}.{format}"
+    subtitle_path = f"{base_name}.{format.name.lower()}"
     
     # Determine the timestamp formatting function
-    timestamp_formatter = format_timestamp_srt if format == 'srt' else format_timestamp_vtt
+    timestamp_formatter = format_timestamp_srt if format == SubFormat.SRT else format_timestamp_vtt
     
-    # Calculate timing for each slide
-    current_time = 0
-    subtitle_items = []
+    # Estimate audio duration based on text length (more accurate if the files are already processed)
+    # For now, estimate ~0.3 seconds per word (rough estimate), at least 1 second per caption
+    word_counts = np.array([len(caption.split()) for caption in captions])
+    durations = np.maximum(word_counts * 0.3, 1.0)
     
-    for i, (text_file, _) in enumerate(file_pairs):
-        # Read caption
-        with open(text_file, 'r', encoding='utf-8') as f:
-            caption = f.read().strip()
-        
-        # Estimate audio duration based on text length (more accurate if the files are already processed)
-        # For now, estimate ~0.3 seconds per word (rough estimate)
-        words = caption.split()
-        estimated_duration = max(len(words) * 0.3, 1.0)  # At least 1 second
-        
-        start_time = current_time
-        end_time = start_time + estimated_duration
-        
-        # Add to subtitle list with index (for SRT)
-        subtitle_items.append((i + 1, start_time, end_time, caption))
-        
-        # Update current time for next subtitle
-        current_time = end_time + pause_duration
+    # Each caption ends after all previous captions and pauses plus its own duration
+    end_times = np.cumsum(durations + pause_duration) - pause_duration
+    start_times = end_times - durations
+    
+    # Subtitle list with index (for SRT)
+    subtitle_items = [(i + 1, start_time, end_time, caption)
+                      for i, (start_time, end_time, caption) in enumerate(zip(start_times, end_times, captions))]
     
     # Write the subtitle file
     with open(subtitle_path, 'w', encoding='utf-8') as f:
         # Write header for VTT
-        if format == 'vtt':
+        if format == SubFormat.VTT:
             f.write("WEBVTT\n\n")
         
         # Write each subtitle entry
         for index, start_time, end_time, text in subtitle_items:
-            if format == 'srt':
+            if format == SubFormat.SRT:
                 # SRT format: index, timestamp range, text, blank line
                 f.write(f"{index}\n")
                 f.write(f"{timestamp_formatter(start_time)} --> {timestamp_formatter(end_time)}\n")
@@ -328,317 +614,215 @@ def create_subtitle_file(file_pairs, output_path, pause_duration=1.0, format='sr
                 f.write(f"{timestamp_formatter(start_time)} --> {timestamp_formatter(end_time)}\n")
                 f.write(f"{text}\n\n")
     
-    print(f"Subtitle file created: {subtitle_path}")
+    log.info("Subtitle file created: %s", subtitle_path)
     return subtitle_path
 
-def create_subtitle_file_from_audio(file_pairs, output_path, pause_duration=1.0, format='srt', 
-                                   offline_tts=False, lang='en', speed_factor=1.0):
-    """Generate a subtitle file with more accurate timing based on actual audio durations"""
-    if format not in ['srt', 'vtt']:
-        raise ValueError(f"Unsupported subtitle format: {format}")
+def create_subtitle_file_from_audio(narration, output_path, pause_duration=1.0, format=SubFormat.SRT):
+    """Generate a subtitle file with accurate timing based on the synthesized narration"""
+    try:
+        format = SubFormat.parse(format)
+    except KeyError:
+        raise ValueError(f"Unsupported subtitle format: {format}") from None
     
     # Calculate base name for subtitle file
     base_name = os.path.splitext(output_path)[0]
-    subtitle_path = f"{base_name}.{format}"
+    subtitle_path = f"{base_name}.{format.name.lower()}"
     
     # Determine the timestamp formatting function
-    timestamp_formatter = format_timestamp_srt if format == 'srt' else format_timestamp_vtt
-    
-    # Create temp directory for test audio files
-    temp_dir = os.path.join(os.path.dirname(output_path) or ".", "temp_subtitle_audio")
-    os.makedirs(temp_dir, exist_ok=True)
+    timestamp_formatter = format_timestamp_srt if format == SubFormat.SRT else format_timestamp_vtt
     
     # Calculate timing for each slide based on actual audio durations
     current_time = 0
     subtitle_items = []
     
-    try:
-        for i, (text_file, _) in enumerate(file_pairs):
-            # Read caption
-            with open(text_file, 'r', encoding='utf-8') as f:
-                caption = f.read().strip()
-            
-            # Generate audio to get accurate duration
-            audio_file = os.path.join(temp_dir, f"audio_sub_{i}.mp3")
-            text_to_speech(caption, audio_file, offline=offline_tts, lang=lang, speed_factor=speed_factor)
-            
-            # Get actual audio duration
-            audio_clip = AudioFileClip(audio_file)
-            audio_duration = audio_clip.duration
-            audio_clip.close()
-            
-            # Set start and end times
-            start_time = current_time
-            end_time = start_time + audio_duration
-            
-            # Add to subtitle list with index (for SRT)
-            subtitle_items.append((i + 1, start_time, end_time, caption))
-            
-            # Update current time for next subtitle
-            current_time = end_time + pause_duration
-    
-        # Write the subtitle file
-        with open(subtitle_path, 'w', encoding='utf-8') as f:
-            # Write header for VTT
-            if format == 'vtt':
-                f.write("WEBVTT\n\n")
-            
-            # Write each subtitle entry
-            for index, start_time, end_time, text in subtitle_items:
-                if format == 'srt':
-                    # SRT format: index, timestamp range, text, blank line
-                    f.write(f"{index}\n")
-                    f.write(f"{timestamp_formatter(start_time)} --> {timestamp_formatter(end_time)}\n")
-                    f.write(f"{text}\n\n")
-                else:
-                    # VTT format: timestamp range, text, blank line
-                    f.write(f"{timestamp_formatter(start_time)} --> {timestamp_formatter(end_time)}\n")
-                    f.write(f"{text}\n\n")
+    for i, result in enumerate(narration):
+        # Set start and end times
+        start_time = current_time
+        end_time = start_time + result.duration
         
-        print(f"Subtitle file created with accurate timing: {subtitle_path}")
-    finally:
-        # Clean up temp directory
-        for file in os.listdir(temp_dir):
-            try:
-                os.remove(os.path.join(temp_dir, file))
-            except:
-                pass
-        try:
-            os.rmdir(temp_dir)
-        except:
-            pass
+        # Add to subtitle list with index (for SRT)
+        subtitle_items.append((i + 1, start_time, end_time, result.caption))
+        
+        # Update current time for next subtitle
+        current_time = end_time + pause_duration
+    
+    # Write the subtitle file
+    with open(subtitle_path, 'w', encoding='utf-8') as f:
+        # Write header for VTT
+        if format == SubFormat.VTT:
+            f.write("WEBVTT\n\n")
+        
+        # Write each subtitle entry
+        for index, start_time, end_time, text in subtitle_items:
+            if format == SubFormat.SRT:
+                # SRT format: index, timestamp range, text, blank line
+                f.write(f"{index}\n")
+                f.write(f"{timestamp_formatter(start_time)} --> {timestamp_formatter(end_time)}\n")
+                f.write(f"{text}\n\n")
+            else:
+                # VTT format: timestamp range, text, blank line
+                f.write(f"{timestamp_formatter(start_time)} --> {timestamp_formatter(end_time)}\n")
+                f.write(f"{text}\n\n")
     
+    log.info("Subtitle file created with accurate timing: %s", subtitle_path)
     return subtitle_path
 
-def create_video(file_pairs, output_path, transition_duration=0.5, music_file=None, music_volume=0.1, 
-              offline_tts=False, pause_duration=1.0, lang='en', speed_factor=1.0, 
-              resolution=(1280, 720), burn_captions=False, caption_font_size=30,
-              caption_position='bottom', caption_font=None, tts_method='gtts', tts_voice=None):
-    """Create a video from the image/text pairs"""
-    # Start timing
-    start_time = time.time()
-    
-    # Create temp directory for audio files
-    temp_dir = os.path.join(os.path.dirname(output_path) or ".", "temp_audio")
-    os.makedirs(temp_dir, exist_ok=True)
-    print(f"Temp audio directory created: {temp_dir}")
-    
-    # Unpack resolution
+def mix_background_music(narration_file, music_file, music_volume, duration, output_file):
+    """Mix looped background music under the narration track and save the result"""
+    # ffmpeg loops the music input as needed, trims it to the narration and sets its volume;
+    # normalize=0 keeps amix from lowering the narration level
+    run_ffmpeg('-i', narration_file, '-stream_loop', '-1', '-i', music_file,
+               '-filter_complex',
+               f"[1:a]volume={music_volume}[music];[0:a][music]amix=inputs=2:duration=first:normalize=0[aout]",
+               '-map', '[aout]', '-t', f"{duration:.3f}", '-c:a', 'pcm_s16le', output_file)
+    return output_file
+
+@functools.lru_cache(maxsize=1)
+def _has_nvenc():
+    """Check whether ffmpeg was built with the NVIDIA NVENC H.264 encoder"""
+    try:
+        encoders = subprocess.check_output([FFMPEG_BINARY, '-hide_banner', '-encoders'],
+                                           stderr=subprocess.DEVNULL, text=True)
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return False
+    return 'h264_nvenc' in encoders
+
+def video_codec_args(preset='veryfast'):
+    """ffmpeg video encoder arguments - NVENC when available, otherwise libx264 with the given preset"""
+    if _has_nvenc():
+        return ['-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr', '-cq', '23']
+    return ['-c:v', 'libx264', '-preset', preset, '-crf', '20']
+
+def compose_video(slides, audio_file, output_path, resolution, transition_duration=0.5, fps=24,
+                  preset='veryfast'):
+    """Encode (image, duration) slides and an audio track into a video with a single ffmpeg filter graph"""
     width, height = resolution
-    print(f"Output video resolution: {width}x{height}")
+    inputs = []
+    filters = []
+    for i, (image_file, duration) in enumerate(slides):
+        # Each still image becomes a looped input lasting the whole slide
+        inputs += ['-loop', '1', '-framerate', str(fps), '-t', f"{duration:.3f}", '-i', image_file]
+        filters.append(f"[{i}:v]scale={width}:{height}:flags=lanczos,setsar=1,fps={fps},format=yuv420p[v{i}]")
     
-    clips = []
+    if len(slides) > 1 and transition_duration > 0:
+        # Chain crossfades, each starting a transition's length before the current end
+        previous = "[v0]"
+        offset = 0
+        for i in range(1, len(slides)):
+            offset += slides[i - 1][1] - transition_duration
+            output = "[vout]" if i == len(slides) - 1 else f"[x{i}]"
+            filters.append(f"{previous}[v{i}]xfade=transition=fade:duration={transition_duration}"
+                           f":offset={offset:.3f}{output}")
+            previous = output
+    else:
+        labels = ''.join(f"[v{i}]" for i in range(len(slides)))
+        filters.append(f"{labels}concat=n={len(slides)}:v=1:a=0[vout]")
     
-    for i, (text_file, image_file) in enumerate(file_pairs):
-        # Read caption
-        with open(text_file, 'r', encoding='utf-8') as f:
-            caption = f.read().strip()
-        
-        print(f"Processing slide {i+1}: {os.path.basename(text_file)}")
-        
-        # Create audio from caption
-        audio_file = os.path.join(temp_dir, f"audio_{i}.mp3")
-        text_to_speech(caption, audio_file, method=tts_method, offline=offline_tts, 
-                       lang=lang, voice=tts_voice, speed_factor=speed_factor)
-        
-        # Get audio duration
-        audio_clip = AudioFileClip(audio_file)
-        audio_duration = audio_clip.duration
-        print(f"  Audio duration: {audio_duration:.2f} seconds")
-        
-        # Create image clip with duration matching the audio + pause
-        # Resize the image to the target resolution
-        image_clip = (ImageClip(image_file)
-                     .set_duration(audio_duration + pause_duration)
-                     .resize(width=width, height=height))
-        
-        # If burn captions option is enabled, overlay text on the image
-        if burn_captions:
-            if not IMAGEMAGICK_AVAILABLE:
-                print("Warning: ImageMagick is not installed or not found in PATH.")
-                print("Cannot burn captions without ImageMagick. Continuing without captions.")
-                print("For installation instructions, see: https://imagemagick.org/script/download.php")
-            else:
-                try:
-                    print(f"  Creating text caption with font size {caption_font_size}")
-                    
-                    # Calculate the usable text width - 80% of video width for safety
-                    max_text_width = int(width * 0.8)
-                    
-                    # Choose a font - start with user font, fallback to language-specific, then default
-                    font_to_use = caption_font
-                    if not font_to_use:
-                        # Try to get language-specific fonts
-                        font_options = LANGUAGE_FONTS.get(lang, LANGUAGE_FONTS['default'])
-                        for font in font_options:
-                            if font:
-                                font_to_use = font
-                                break
-                    
-                    bg_color = '#000000af'
-                    # Create a simplified TextClip with background color
-                    # Use method='caption' for text wrapping and alignment
-                    caption_clip = TextClip(
-                        caption,
-                        fontsize=caption_font_size,
-                        color='white',
-                        bg_color=bg_color,  # RGBA with alpha for semi-transparency
-                        font=font_to_use,
-                        method='caption',
-                        align='center',
-                        size=(max_text_width, None),
-                    )
-                    
-                    # Define vertical margin for captions
-                    caption_vertical_margin = 20  # pixels from top or bottom edge
-                    
-                    # Position the caption on the main video based on user choice
-                    if caption_position == 'top':
-                        caption_clip = caption_clip.set_position(('center', caption_vertical_margin))
-                    elif caption_position == 'middle':
-                        caption_clip = caption_clip.set_position('center')
-                    else:  # bottom
-                        # For bottom position, we need to calculate the distance from the bottom
-                        # Using lambda function to dynamically calculate the position based on frame size
-                        y = height - caption_clip.h - caption_vertical_margin
-                        caption_clip = caption_clip.set_position(lambda t: ('center', y))
-                        print(f"  Caption height: {caption_clip.h}, y: {y}")
-                    
-                    # Set duration to match the image clip
-                    caption_clip = caption_clip.set_duration(image_clip.duration)
-                    
-                    # Create a black background clip with the full resolution size
-                    background_clip = ColorClip(size=(width, height), 
-                                              color=(0, 0, 0), 
-                                              duration=image_clip.duration)
-                    
-                    # Center the image on the background
-                    image_clip = image_clip.set_position('center')
-                    
-                    # Overlay both the image and caption on the background clip
-                    # This ensures the caption has enough space and won't be truncated
-                    image_clip = CompositeVideoClip([background_clip, image_clip, caption_clip], use_bgclip=True)
-                    
-                    # Save the image clip to make sure the caption is in the right place
-                    try:
-                        if not os.path.exists(temp_dir):
-                            os.makedirs(temp_dir)
-                        temp_frame_path = os.path.join(temp_dir, f"frame_{len(clips):03d}.png")
-                        image_clip.save_frame(temp_frame_path, t=0)
-                        print(f"  Saved frame to: {temp_frame_path}")
-                        image_clip = (ImageClip(temp_frame_path)
-                          .set_duration(image_clip.duration)
-                          .resize(width=width, height=height))
-                    except Exception as e:
-                        print(f"  Warning: Could not save frame: {e}")
-                    
-                    print(f"  Successfully added caption using font: {font_to_use or 'default'}")
-                except Exception as e:
-                    print(f"Error adding captions: {e}")
-                    print("Continuing without captions for this slide.")
-        
-        # Make sure the audio clip duration doesn't exceed its intended duration
-        audio_clip = audio_clip.set_duration(audio_duration)
-        
-        # Position the audio at the beginning of the slide (leaving silence at the end)
-        audio_clip = audio_clip.set_start(0)
-        
-        # Add audio to image
-        video_clip = image_clip.set_audio(audio_clip)
-        
-        print(f"  Slide duration with pause: {audio_duration + pause_duration:.2f} seconds")
-        clips.append(video_clip)
+    inputs += ['-i', audio_file]
+    args = [*inputs,
+            '-filter_complex', ';'.join(filters),
+            '-map', '[vout]', '-map', f"{len(slides)}:a"]
+    output_args = ['-pix_fmt', 'yuv420p', '-r', str(fps), '-c:a', 'aac', '-b:a', '192k', '-shortest',
+                   output_path]
+    codec_args = video_codec_args(preset)
+    try:
+        run_ffmpeg(*args, *codec_args, *output_args)
+    except subprocess.CalledProcessError:
+        if codec_args[1] != 'h264_nvenc':
+            raise
+        # NVENC is compiled in but no usable GPU was found, so fall back to the CPU encoder
+        log.warning("NVENC encoding failed, falling back to libx264")
+        run_ffmpeg(*args, '-c:v', 'libx264', '-preset', preset, '-crf', '20', *output_args)
+    return output_path
+
+def create_video(file_pairs, narration, output_path, temp_dir, transition_duration=0.5, music_file=None,
+              music_volume=0.1, pause_duration=1.0, lang='en', resolution=(1280, 720),
+              burn_captions=False, caption_font_size=30, caption_position=CaptionPos.BOTTOM, caption_font=None,
+              preset='veryfast', image_jobs=None):
+    """Create a video from the image/text pairs and their synthesized narration
     
-    print(f"Created {len(clips)} video clips")
+    image_jobs can hold the futures from prepare_images() if the slide images were
+    already being resized in the background; otherwise they are resized here.
+    """
+    # Unpack resolution
+    width, height = resolution
+    log.info("Output video resolution: %sx%s", width, height)
     
-    # Apply transitions if specified
-    if len(clips) > 1 and transition_duration > 0:
-        print(f"Applying {transition_duration}s transitions between clips")
-        
-        # Create a list of clips with transitions applied
-        final_clips = [clips[0]]
-        
-        # Apply crossfadein to all clips except the first one
-        for i in range(1, len(clips)):
-            # Ensure audio doesn't overlap during transitions by explicitly managing it
-            clip_with_transition = clips[i].crossfadein(transition_duration)
-            
-            # Make sure the audio from this clip starts only when the clip actually starts
-            if clip_with_transition.audio is not None:
-                # The audio should start after the transition begins
-                clip_audio = clip_with_transition.audio.set_start(0)
-                clip_with_transition = clip_with_transition.set_audio(clip_audio)
-                
-            final_clips.append(clip_with_transition)
-        
-        # Concatenate with negative padding to create the crossfade overlap effect
-        final_clip = concatenate_videoclips(final_clips, method="compose", padding=-transition_duration)
-        print(f"Final duration with transitions: {final_clip.duration:.2f} seconds")
-    else:
-        # Simple concatenation without transitions
-        final_clip = concatenate_videoclips(clips, method="compose")
-        print(f"Final duration without transitions: {final_clip.duration:.2f} seconds")
+    audio_files = [result.audio_file for result in narration]
+    slides = []
     
-    print(f"Audio present in final clip: {final_clip.audio is not None}")
+    # Caption styling is the same for every slide
+    if burn_captions:
+        font, font_name, _ = _resolve_font(lang, caption_font, caption_font_size)
+    caption_vertical_margin = 20  # pixels from top or bottom edge
+    # Calculate the usable text width - 80% of video width for safety
+    max_text_width = int(width * 0.8)
     
-    # Add background music if specified
-    if music_file and os.path.exists(music_file):
-        background_music = AudioFileClip(music_file)
+    for i, ((text_file, image_file), result) in enumerate(zip(file_pairs, narration)):
+        log.info("Processing slide %s: %s", i+1, os.path.basename(text_file))
+        log.info("  Audio duration: %.2f seconds", result.duration)
         
-        # Loop the music if it's shorter than the video
-        if background_music.duration < final_clip.duration:
-            # Calculate how many loops we need
-            loops_needed = int(final_clip.duration / background_music.duration) + 1
-            # Create a list of the same audio clip multiple times
-            music_clips = [background_music] * loops_needed
-            # Concatenate them
-            background_music = concatenate_audioclips(music_clips)
+        # Resize the image to the target resolution once, up front,
+        # rather than resampling the full-size image for every frame
+        if image_jobs:
+            resized_image = image_jobs[i].result()
+        else:
+            resized_image = prepare_image(image_file, os.path.join(temp_dir, f"img_{i}.png"), (width, height))
         
-        # Trim the music to match the video duration
-        background_music = background_music.subclip(0, final_clip.duration)
+        # Each slide shows a still image for the duration of the audio + pause
+        slide_image = resized_image
+        slide_duration = result.duration + pause_duration
         
-        # Set the volume
-        background_music = background_music.volumex(music_volume)
+        # If burn captions option is enabled, draw the text onto the slide image
+        if burn_captions:
+            try:
+                log.info("  Creating text caption with font size %s", caption_font_size)
+                slide_image = burn_caption(resized_image, os.path.join(temp_dir, f"frame_{i:03d}.png"),
+                                           result.caption, font, caption_position, max_text_width,
+                                           caption_vertical_margin)
+                log.info("  Successfully added caption using font: %s", font_name or 'default')
+            except Exception as e:
+                log.warning("Error adding captions: %s", e)
+                log.warning("Continuing without captions for this slide.")
         
-        # Mix the audio
-        if final_clip.audio is not None:
-            final_audio = CompositeAudioClip([final_clip.audio, background_music])
-            final_clip = final_clip.set_audio(final_audio)
-        else:
-            final_clip = final_clip.set_audio(background_music)
-            print("Warning: No audio found in clips, using only background music")
-    else:
-        if final_clip.audio is None:
-            print("Error: No audio found in the final clip")
+        log.info("  Slide duration with pause: %.2f seconds", slide_duration)
+        slides.append((slide_image, slide_duration))
     
-    # Write the final video file
-    print(f"Writing video to {output_path}")
-    # Use a specific codec and bitrate for better quality
-    final_clip.write_videofile(output_path, fps=24, audio_codec="aac", audio_bitrate="192k")
+    log.info("Prepared %s slides", len(slides))
     
-    # Clean up temp directory
-    for file in os.listdir(temp_dir):
-        os.remove(os.path.join(temp_dir, file))
-    os.rmdir(temp_dir)
-    print(f"Temp directory cleaned up: {temp_dir}")
+    # Each crossfade must be shorter than the slides it joins, or the xfade offsets stop advancing.
+    # It also can't be longer than the pause, or it would cut off the end of the narration
+    if len(slides) > 1 and transition_duration > 0:
+        max_transition = min(pause_duration, min(duration for _, duration in slides) - 0.1)
+        if transition_duration > max_transition:
+            transition_duration = max(round(max_transition, 2), 0)
+            log.warning("Transition shortened to %ss to fit the pause and the shortest slide",
+                        transition_duration)
     
-    # Calculate and display total processing time
-    end_time = time.time()
-    total_time = end_time - start_time
+    use_transitions = len(slides) > 1 and transition_duration > 0
+    overlap = transition_duration if use_transitions else 0
+    total_duration = sum(duration for _, duration in slides) - overlap * (len(slides) - 1)
     
-    # Format the time nicely
-    hours, remainder = divmod(total_time, 3600)
-    minutes, seconds = divmod(remainder, 60)
+    # Join all narration into one track with ffmpeg. Each slide's audio starts with the slide and
+    # lasts until the next one starts, i.e. the slide minus the overlap taken by the next transition
+    segments = [duration - overlap for _, duration in slides[:-1]] + [slides[-1][1]]
+    final_audio = merge_audio(audio_files, segments, os.path.join(temp_dir, "merged_audio.wav"))
     
-    if hours > 0:
-        time_str = f"{int(hours)}h {int(minutes)}m {seconds:.2f}s"
-    elif minutes > 0:
-        time_str = f"{int(minutes)}m {seconds:.2f}s"
+    if use_transitions:
+        log.info("Applying %ss transitions between clips", transition_duration)
+        log.info("Final duration with transitions: %.2f seconds", total_duration)
     else:
-        time_str = f"{seconds:.2f}s"
+        log.info("Final duration without transitions: %.2f seconds", total_duration)
+    
+    # Add background music if specified
+    if music_file:
+        final_audio = mix_background_music(final_audio, music_file, music_volume, total_duration,
+                                           os.path.join(temp_dir, "mixed_audio.wav"))
     
-    print(f"\nTotal processing time: {time_str}")
-    print(f"Average processing time per slide: {(total_time / len(file_pairs)):.2f} seconds")
+    # Write the final video file
+    log.info("Writing video to %s", output_path)
+    compose_video(slides, final_audio, output_path, resolution, transition_duration if use_transitions else 0,
+                  preset=preset)
     
     return output_path
 
@@ -650,34 +834,66 @@ def list_supported_languages():
         print(f"{code}: {name}")
     print("\nNote: Offline TTS with pyttsx3 may have limited language support.")
 
+def _cached_json(path, ttl_hours, fetch):
+    """Return the JSON data cached at path if it is fresh, otherwise call fetch() and cache its result
+    
+    Empty results are never cached, so e.g. fonts installed right after a scan that found none show up.
+    """
+    try:
+        if time.time() - os.path.getmtime(path) < ttl_hours * 3600:
+            with open(path, encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached:
+                return cached
+    except (OSError, ValueError):
+        pass  # Missing or unreadable cache, fetch it again
+    
+    data = fetch()
+    if not data:
+        return data
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    except OSError:
+        pass  # Caching is only an optimization
+    return data
+
+def _scan_fonts():
+    """Walk the system font directories and return the sorted font file names"""
+    # The directories Pillow searches when a font is given by file name
+    if sys.platform == 'win32':
+        font_dirs = [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')]
+    elif sys.platform == 'darwin':
+        font_dirs = ['/Library/Fonts', '/System/Library/Fonts', os.path.expanduser('~/Library/Fonts')]
+    else:
+        data_home = os.environ.get('XDG_DATA_HOME') or os.path.expanduser('~/.local/share')
+        data_dirs = (os.environ.get('XDG_DATA_DIRS') or '/usr/local/share:/usr/share').split(':')
+        font_dirs = [os.path.join(d, 'fonts') for d in [data_home] + data_dirs]
+    
+    fonts = set()
+    for font_dir in font_dirs:
+        for _, _, files in os.walk(font_dir):
+            fonts.update(f for f in files if f.lower().endswith(('.ttf', '.otf', '.ttc')))
+    return sorted(fonts, key=str.lower)
+
 def list_available_fonts():
-    """Print the list of available fonts for TextClip"""
-    if not IMAGEMAGICK_AVAILABLE:
-        print("\nError: ImageMagick is not installed or not found in PATH.")
-        print("ImageMagick is required for TextClip and font listing functionality.")
-        print("For installation instructions, visit: https://imagemagick.org/script/download.php")
-        print("\nAfter installing ImageMagick, make sure it's in your system PATH.")
+    """Print the list of font files available for caption rendering"""
+    # Walking the font directories is slow on systems with many fonts, so reuse the last scan for a day
+    fonts = _cached_json(os.path.join(CACHE_DIR, 'fonts.json'), 24, _scan_fonts)
+    
+    if not fonts:
+        print("\nNo fonts found in the system font directories.")
+        print("Use --caption-font with a full path to a .ttf/.otf font file instead.")
         return
         
-    try:
-        from moviepy.video.VideoClip import TextClip
-        print("\nQuerying available fonts from ImageMagick...")
-        fonts = TextClip.list('font')
-        
-        if not fonts:
-            print("\nNo fonts found. This might indicate an issue with your ImageMagick installation.")
-            return
-            
-        print(f"\nFound {len(fonts)} available fonts:")
-        print("============================")
-        for font in sorted(fonts):
-            print(font)
-        print("\nUsage: Use these font names with the --caption-font option.")
-        print("Note: Font availability may vary depending on your system configuration.")
-    except Exception as e:
-        print(f"\nError listing fonts: {e}")
-        print("This could be due to issues with ImageMagick configuration or installation.")
-        print("Make sure ImageMagick is properly installed and in your system PATH.")
+    print(f"\nFound {len(fonts)} available fonts:")
+    print("============================")
+    for font in fonts:
+        print(font)
+    print("\nUsage: Use these font file names (or a full path to a font file) with the --caption-font option.")
+    print("Note: Font availability may vary depending on your system configuration.")
+    print(f"The font list is cached for 24 hours; delete {CACHE_DIR} to rescan newly installed fonts.")
 
 def list_edge_voices():
     """Print available voices for Edge TTS"""
@@ -689,35 +905,19 @@ def list_edge_voices():
             print(f"  - {voice}")
     sys.exit(0)
 
-def main():
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command-line parser (once per process)"""
     parser = argparse.ArgumentParser(description='Generate a video from text and image files')
     
-    # Add arguments that only require input_dir for video generation
+    # input_dir is optional at parse time so the --list-* options work without it
+    parser.add_argument('input_dir', nargs='?', help='Directory containing text and image files')
     parser.add_argument('--list-languages', action='store_true',
                         help='List all supported languages and exit')
     parser.add_argument('--list-fonts', action='store_true',
                         help='List all available fonts for captions and exit')
     parser.add_argument('--list-voices', action='store_true',
                         help='List available voices for Edge TTS and exit')
-                        
-    # Only parse these arguments first
-    args, remaining_argv = parser.parse_known_args()
-    
-    # If just listing fonts or languages, we don't need input_dir
-    if args.list_languages:
-        list_supported_languages()
-        return
-        
-    if args.list_fonts:
-        list_available_fonts()
-        return
-        
-    if args.list_voices:
-        list_edge_voices()
-        return
-        
-    # Add all other arguments for normal operation
-    parser.add_argument('input_dir', help='Directory containing text and image files')
     parser.add_argument('--output', '-o', default='output.mp4', help='Output video file path')
     parser.add_argument('--transition', '-t', type=float, default=0.5, 
                         help='Duration of transition between slides (seconds, 0 for no transition)')
@@ -744,6 +944,10 @@ def main():
                         help='Position for text captions')
     parser.add_argument('--caption-font', 
                         help='Font file path or name for captions')
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='Answer yes to prompts (use the built-in font if no caption font is found)')
+    parser.add_argument('--no-captions-fallback', action='store_true',
+                        help='Skip burned-in captions instead of prompting if no caption font is found')
     parser.add_argument('--generate-subtitles', action='store_true',
                         help='Generate a subtitle file alongside the video')
     parser.add_argument('--subtitle-format', choices=['srt', 'vtt'], default='srt',
@@ -754,90 +958,217 @@ def main():
                         help='TTS method to use: gtts (Google), edge (Microsoft Edge), pyttsx3 (offline)')
     parser.add_argument('--tts-voice', '-tv', type=str, default=None,
                         help='TTS voice to use (available for edge TTS method)')
-    
-    # Parse all arguments
-    args = parser.parse_args(remaining_argv, namespace=args)
-    
-    # Check if ImageMagick is installed when burn_captions is requested
-    if args.burn_captions and not IMAGEMAGICK_AVAILABLE:
-        print("WARNING: --burn-captions requires ImageMagick, but it is not installed or not found in PATH.")
-        print("The video will be created without captions.")
-        print("For installation instructions, visit: https://imagemagick.org/script/download.php")
-        print("After installing ImageMagick, make sure it's in your system PATH.")
-        print("")
-        
-        # Ask if user wants to continue
-        if sys.stdin.isatty():  # Only prompt if running interactively
-            response = input("Do you want to continue without captions? (y/n): ")
-            if response.lower() != 'y':
-                print("Aborting.")
-                return
-    
+    parser.add_argument('--tts-concurrency', '-tc', type=int, default=TTS_CONCURRENCY,
+                        help=f'Maximum number of captions synthesized at once (default: {TTS_CONCURRENCY})')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Only print warnings and errors, not progress messages')
+    parser.add_argument('--preset', default='veryfast',
+                        choices=['ultrafast', 'superfast', 'veryfast', 'faster', 'fast',
+                                 'medium', 'slow', 'slower', 'veryslow'],
+                        help='libx264 encoding preset; faster presets encode quicker at a larger file size '
+                             '(default: veryfast, ignored when NVENC is used)')
+    return parser
+
+def _validate(args):
+    """Check speed, resolution, caption size and language; return an error message, or None if usable"""
     # Validate speed factor
     if args.speed <= 0:
-        print(f"Error: Speed factor must be positive. Got {args.speed}")
-        return
+        return f"Speed factor must be positive. Got {args.speed}"
     elif args.speed > 3.0:
-        print(f"Warning: Very high speed factor ({args.speed}). Speech may be difficult to understand.")
+        log.warning("Very high speed factor (%s). Speech may be difficult to understand.", args.speed)
+    
+    # Validate TTS concurrency
+    if args.tts_concurrency < 1:
+        return f"TTS concurrency must be at least 1. Got {args.tts_concurrency}"
     
     # Validate resolution
     if args.width <= 0 or args.height <= 0:
-        print(f"Error: Width and height must be positive. Got {args.width}x{args.height}")
-        return
+        return f"Width and height must be positive. Got {args.width}x{args.height}"
     elif args.width > 3840 or args.height > 2160:
-        print(f"Warning: Very high resolution ({args.width}x{args.height}). This may result in slow processing.")
+        log.warning("Very high resolution (%sx%s). This may result in slow processing.",
+                    args.width, args.height)
+    
+    # Validate caption font size
+    if args.caption_font_size <= 0:
+        return f"Caption font size must be positive. Got {args.caption_font_size}"
     
     # Check if the specified language is supported
-    if args.language not in SUPPORTED_LANGUAGES:
-        print(f"Warning: Language '{args.language}' is not in the list of recognized languages.")
-        print("The speech synthesis might not work properly.")
-        print("Use --list-languages to see all supported languages.")
+    language_name = SUPPORTED_LANGUAGES.get(args.language)
+    if language_name is None:
+        log.warning("Language '%s' is not in the list of recognized languages.", args.language)
+        log.warning("The speech synthesis might not work properly.")
+        log.warning("Use --list-languages to see all supported languages.")
     else:
-        print(f"Using language: {SUPPORTED_LANGUAGES[args.language]} ({args.language})")
+        log.info("Using language: %s (%s)", language_name, args.language)
+    
+    return None
+
+def main():
+    parser = _build_parser()
+    
+    # Parse all arguments
+    args = parser.parse_args()
     
-    print(f"Speech speed factor: {args.speed}x")
-    print(f"Output resolution: {args.width}x{args.height}")
+    # Progress messages go to stdout, warnings and errors to stderr; --quiet keeps only the latter
+    if not log.handlers:
+        progress = logging.StreamHandler(sys.stdout)
+        progress.addFilter(lambda record: record.levelno < logging.WARNING)
+        problems = logging.StreamHandler(sys.stderr)
+        problems.setLevel(logging.WARNING)
+        for handler in (progress, problems):
+            handler.setFormatter(_LevelFormatter())
+            log.addHandler(handler)
+        log.propagate = False
+    log.setLevel(logging.WARNING if args.quiet else logging.INFO)
     
-    # Ensure input directory exists
-    if not os.path.isdir(args.input_dir):
-        print(f"Error: Directory '{args.input_dir}' does not exist")
+    # If just listing fonts or languages, we don't need input_dir
+    if args.list_languages:
+        list_supported_languages()
         return
+        
+    if args.list_fonts:
+        list_available_fonts()
+        return
+        
+    if args.list_voices:
+        list_edge_voices()
+        return
+    
+    if args.input_dir is None:
+        parser.error("the following arguments are required: input_dir")
+    
+    # argparse has already checked these against their choices
+    args.caption_position = CaptionPos.parse(args.caption_position)
+    args.subtitle_format = SubFormat.parse(args.subtitle_format)
+    args.tts_method = TTSMethod.parse(args.tts_method)
     
-    # Get file pairs
-    pairs = get_file_pairs(args.input_dir)
+    # Check the pure arguments before doing any filesystem work
+    error = _validate(args)
+    if error:
+        log.error("%s", error)
+        return 1
+    
+    # Check that a TrueType font can be found when burn_captions is requested
+    font_name = None
+    if args.burn_captions:
+        _, font_name, language_font = _resolve_font(args.language, args.caption_font, args.caption_font_size)
+        if args.caption_font and font_name != args.caption_font:
+            log.warning("Could not load caption font '%s'. Using %s instead.",
+                        args.caption_font, font_name or "Pillow's built-in font")
+        if font_name is not None and not language_font:
+            log.warning("No %s caption font found, so captions use %s and may show as boxes.",
+                        SUPPORTED_LANGUAGES.get(args.language, args.language), font_name)
+            log.warning("Install one of %s, or pass a font file path with --caption-font.",
+                        ', '.join(LANGUAGE_FONTS[args.language]))
+    if args.burn_captions and font_name is None:
+        log.warning("--burn-captions could not find a TrueType font for the captions.")
+        log.warning("The captions will use Pillow's built-in font, which may not support your language.")
+        log.warning("Use --list-fonts to see available fonts, or pass a font file path with --caption-font.")
+        
+        # Decide from the flags first, so scripted runs never block on a prompt
+        if args.no_captions_fallback:
+            log.info("Skipping burned-in captions (--no-captions-fallback).")
+            args.burn_captions = False
+        elif args.yes:
+            log.info("Continuing with the built-in font (--yes).")
+        elif sys.stdin.isatty():  # Only prompt if running interactively
+            response = input("Do you want to continue with the built-in font? (y/n): ")
+            if response.lower() != 'y':
+                log.warning("Aborting.")
+                return
+        else:
+            log.error("Not running interactively. Pass --yes to use the built-in font, "
+                      "or --no-captions-fallback to skip burned-in captions.")
+            return 1
+    
+    # Check that the music file can be opened before doing any synthesis
+    if args.music:
+        try:
+            with open(args.music, 'rb'):
+                pass
+        except OSError as e:
+            log.warning("Cannot open music file '%s': %s. Continuing without background music.",
+                        args.music, e)
+            args.music = None
+    
+    log.info("Speech speed factor: %sx", args.speed)
+    log.info("Output resolution: %sx%s", args.width, args.height)
+    
+    # Get file pairs, which also ensures the input directory exists and is readable
+    try:
+        pairs = get_file_pairs(args.input_dir)
+    except OSError as e:
+        log.error("Cannot read input directory '%s': %s", args.input_dir, e)
+        return 1
     if not pairs:
-        print("No valid text/image pairs found")
+        log.warning("No valid text/image pairs found")
         return
     
-    print(f"Found {len(pairs)} text/image pairs")
+    log.info("Found %s text/image pairs", len(pairs))
     
-    # Check if music file exists if specified
-    if args.music and not os.path.exists(args.music):
-        print(f"Warning: Music file '{args.music}' not found. Continuing without background music.")
-        args.music = None
+    # Read every caption once; all later steps work from this list
+    captions = read_captions(pairs)
     
     # Create output directory if needed
     output_dir = os.path.dirname(args.output)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-    
-    # Generate subtitles if requested
-    if args.generate_subtitles:
-        print(f"Generating {args.subtitle_format.upper()} subtitle file...")
-        subtitle_path = create_subtitle_file_from_audio(
-            pairs, args.output, args.pause, args.subtitle_format,
-            args.offline_tts, args.language, args.speed
-        )
-        print(f"Subtitle file created: {subtitle_path}")
-    
-    # Generate the video
-    output_path = create_video(pairs, args.output, args.transition, args.music, 
-                              args.music_volume, args.offline_tts, args.pause, 
-                              args.language, args.speed, resolution=(args.width, args.height),
-                              burn_captions=args.burn_captions, caption_font_size=args.caption_font_size,
-                              caption_position=args.caption_position, caption_font=args.caption_font,
-                              tts_method=args.tts_method, tts_voice=args.tts_voice)
-    print(f"Video successfully created: {output_path}")
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    # Start timing
+    start_time = time.time()
+    
+    # Create a private temp directory for audio and image files, so concurrent runs don't collide
+    temp_dir = tempfile.mkdtemp(prefix="quick_cut_")
+    log.info("Temp audio directory created: %s", temp_dir)
+    
+    try:
+        # Resize the slide images in the background while the (network-bound) narration is synthesized
+        with ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, len(pairs))) as image_pool:
+            image_jobs = prepare_images(pairs, temp_dir, (args.width, args.height), image_pool)
+            
+            # Synthesize the narration once; subtitles and video both reuse it
+            narration = synth_all_captions(captions, temp_dir, method=args.tts_method, offline=args.offline_tts,
+                                           lang=args.language, voice=args.tts_voice, speed_factor=args.speed,
+                                           concurrency=args.tts_concurrency)
+            
+            # Generate subtitles if requested
+            if args.generate_subtitles:
+                log.info("Generating %s subtitle file...", args.subtitle_format.name)
+                subtitle_path = create_subtitle_file_from_audio(
+                    narration, args.output, args.pause, args.subtitle_format
+                )
+                log.info("Subtitle file created: %s", subtitle_path)
+            
+            # Generate the video
+            output_path = create_video(pairs, narration, args.output, temp_dir, args.transition, args.music,
+                                       args.music_volume, args.pause, args.language,
+                                       resolution=(args.width, args.height),
+                                       burn_captions=args.burn_captions, caption_font_size=args.caption_font_size,
+                                       caption_position=args.caption_position, caption_font=args.caption_font,
+                                       preset=args.preset, image_jobs=image_jobs)
+    finally:
+        # Clean up temp directory
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        log.info("Temp directory cleaned up: %s", temp_dir)
+    
+    # Calculate and display total processing time
+    end_time = time.time()
+    total_time = end_time - start_time
+    
+    # Format the time nicely
+    hours, remainder = divmod(total_time, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    
+    if hours > 0:
+        time_str = f"{int(hours)}h {int(minutes)}m {seconds:.2f}s"
+    elif minutes > 0:
+        time_str = f"{int(minutes)}m {seconds:.2f}s"
+    else:
+        time_str = f"{seconds:.2f}s"
+    
+    log.info("\nTotal processing time: %s", time_str)
+    log.info("Average processing time per slide: %.2f seconds", total_time / len(pairs))
+    log.info("Video successfully created: %s", output_path)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file